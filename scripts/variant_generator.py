@@ -7,13 +7,18 @@ Generates deterministic, unique assignment parameters per student.
 import hashlib
 import random
 import json
-import csv
-from typing import Any, Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
+import re
+import functools
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Callable, Tuple
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VariantConfig:
     """Configuration for variant generation."""
     assignment_id: str
@@ -22,7 +27,7 @@ class VariantConfig:
     seed_salt: str = "GGY3601_2025"  # Course-specific salt
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StudentVariant:
     """Generated variant for a student."""
     student_id: str
@@ -31,17 +36,43 @@ class StudentVariant:
     parameters: Dict[str, Any]
 
 
+def group_only(generator_func: Callable) -> Callable:
+    """
+    Mark a parameter generator whose value depends only on group_id.
+
+    Such generators must not draw from rng and must return an immutable
+    value (str, number, tuple, or a MappingProxyType in place of a dict).
+    generate_batch calls them once per group and shares that same object
+    between all students in the group without copying it.
+    """
+    generator_func.group_only = True
+    return generator_func
+
+
 class VariantGenerator:
     """Generates unique, deterministic variants for students."""
 
     def __init__(self, config: VariantConfig):
         self.config = config
+        # Hash state after the constant "assignment:salt:" prefix; copied per student
+        self._seed_prefix_hash = hashlib.sha256(f"{config.assignment_id}:{config.seed_salt}:".encode())
 
     def _compute_seed(self, student_id: str) -> int:
         """Compute deterministic seed from student identifier."""
-        combined = f"{self.config.assignment_id}:{self.config.seed_salt}:{student_id}"
-        hash_bytes = hashlib.sha256(combined.encode()).digest()
-        return int.from_bytes(hash_bytes[:8], byteorder='big')
+        hasher = self._seed_prefix_hash.copy()
+        hasher.update(student_id.encode())
+        return int.from_bytes(hasher.digest()[:8], byteorder='big')
+
+    def _compute_seeds_batch(self, student_ids: List[str]) -> List[int]:
+        """Compute deterministic seeds for many students in one pass."""
+        copy_prefix = self._seed_prefix_hash.copy
+        from_bytes = int.from_bytes
+        seeds = []
+        for sid in student_ids:
+            hasher = copy_prefix()
+            hasher.update(sid.encode())
+            seeds.append(from_bytes(hasher.digest()[:8], byteorder='big'))
+        return seeds
 
     def _compute_group(self, seed: int) -> int:
         """Assign student to a variant group."""
@@ -50,7 +81,9 @@ class VariantGenerator:
     def generate_variant(
         self,
         student_id: str,
-        param_generators: Dict[str, Callable]
+        param_generators: Mapping[str, Callable],
+        seed: Optional[int] = None,
+        group_cache: Optional[Dict[Tuple[str, int], Any]] = None
     ) -> StudentVariant:
         """
         Generate a variant for a student.
@@ -59,11 +92,15 @@ class VariantGenerator:
             student_id: Student's ID or GitHub username
             param_generators: Dict of parameter names to generator functions
                              Each function takes (random_instance, group_id) and returns a value
+            seed: Precomputed seed for this student (computed if not given)
+            group_cache: Memo of @group_only generator values keyed by
+                         (param_name, group_id), shared across a batch
 
         Returns:
             StudentVariant with all generated parameters
         """
-        seed = self._compute_seed(student_id)
+        if seed is None:
+            seed = self._compute_seed(student_id)
         group_id = self._compute_group(seed) if self.config.variant_strategy != 'unique' else None
 
         # Create seeded random instance for reproducibility
@@ -72,7 +109,20 @@ class VariantGenerator:
         # Generate parameters
         parameters = {}
         for param_name, generator_func in param_generators.items():
-            parameters[param_name] = generator_func(rng, group_id)
+            if (group_cache is not None and group_id is not None
+                    and getattr(generator_func, 'group_only', False)):
+                key = (param_name, group_id)
+                if key not in group_cache:
+                    value = generator_func(rng, group_id)
+                    if isinstance(value, (list, dict, set)):
+                        raise TypeError(
+                            f"@group_only generator '{param_name}' returned a mutable "
+                            f"{type(value).__name__}; return a tuple or MappingProxyType"
+                        )
+                    group_cache[key] = value
+                parameters[param_name] = group_cache[key]
+            else:
+                parameters[param_name] = generator_func(rng, group_id)
 
         return StudentVariant(
             student_id=student_id,
@@ -84,10 +134,15 @@ class VariantGenerator:
     def generate_batch(
         self,
         student_ids: List[str],
-        param_generators: Dict[str, Callable]
+        param_generators: Mapping[str, Callable]
     ) -> List[StudentVariant]:
         """Generate variants for multiple students."""
-        return [self.generate_variant(sid, param_generators) for sid in student_ids]
+        seeds = self._compute_seeds_batch(student_ids)
+        group_cache: Dict[Tuple[str, int], Any] = {}
+        return [
+            self.generate_variant(sid, param_generators, seed=seed, group_cache=group_cache)
+            for sid, seed in zip(student_ids, seeds)
+        ]
 
 
 # ============================================================================
@@ -377,8 +432,93 @@ def create_miniproject_generators() -> Dict[str, Callable]:
 # DATA GENERATION
 # ============================================================================
 
-def generate_sample_data(variant: StudentVariant, output_path: Path, assignment_type: str):
-    """Generate student-specific CSV data files based on variant parameters."""
+SAMPLE_ROCK_TYPES = ['Granite', 'Basalt', 'Sandstone', 'Schist', 'Gneiss']
+ASSAY_LITHOLOGIES = ['Granite', 'Basalt', 'Schist', 'Quartzite', 'Gneiss']
+ASSAY_QUALITIES = ['Good', 'Fair', 'Rejected']
+
+# Pre-formatted labels, indexed by integer draws instead of formatting per row
+ASSAY_HOLE_IDS = [f"DH-{h:02d}" for h in range(1, 6)]
+ASSAY_MONTHS = [f"2024-{m:02d}" for m in range(1, 13)]
+ASSAY_DAYS = [f"{d:02d}" for d in range(1, 29)]
+
+SAMPLES_HEADER = ['sample_id', 'rock_type', 'grade', 'depth', 'mass', 'location']
+ASSAYS_HEADER = ['sample_id', 'hole_id', 'from_depth', 'to_depth', 'lithology',
+                 'Au_ppm', 'Cu_pct', 'Ag_ppm', 'Fe_pct', 'S_pct', 'sample_quality', 'assay_date']
+
+
+class BatchWriter:
+    """
+    Queue generated files in memory and write them together.
+
+    When data is generated for a whole class, each student produces several
+    small files. drain() writes everything queued from a thread pool so the
+    open/write/close round trips overlap instead of running back to back.
+    Also usable as a context manager, which drains on a clean exit; if the
+    with-block raises, queued files are discarded rather than written.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._pending: List[Tuple[Path, bytes]] = []
+
+    def submit_write(self, path: Path, data: bytes) -> None:
+        """Queue data to be written to path on the next drain()."""
+        self._pending.append((Path(path), data))
+
+    def drain(self) -> None:
+        """Write all queued files and clear the queue."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), pending))
+
+    def __enter__(self) -> 'BatchWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if exc_info[0] is None:
+            self.drain()
+        else:
+            self._pending = []
+
+
+def _write_csv_lines(path: Path, lines: List[str], batch_writer: Optional[BatchWriter] = None) -> None:
+    """
+    Write pre-formatted CSV lines in a single call.
+
+    None of the generated fields contain delimiters or quotes, so rows are
+    formatted directly with f-strings and the csv module's quoting logic is
+    skipped. Lines end in CRLF to match csv.writer's default dialect.
+    """
+    data = ("\r\n".join(lines) + "\r\n").encode()
+    if batch_writer is not None:
+        batch_writer.submit_write(path, data)
+    else:
+        path.write_bytes(data)
+
+
+def generate_sample_data(
+    variant: StudentVariant,
+    output_path: Path,
+    assignment_type: str,
+    fast: bool = False,
+    batch_writer: Optional[BatchWriter] = None
+):
+    """
+    Generate student-specific CSV data files based on variant parameters.
+
+    With fast=True the columns are drawn as NumPy arrays instead of row by
+    row. The output is still deterministic per seed, but uses a different
+    RNG stream, so values differ from the default path.
+
+    If batch_writer is given, the CSV is queued on it instead of being
+    written immediately; call batch_writer.drain() to flush.
+    """
+    if fast:
+        _generate_sample_data_vectorized(variant, output_path, assignment_type, batch_writer)
+        return
+
     rng = random.Random(variant.variant_seed)
 
     if assignment_type in ['lab04', 'lab05', 'ca01']:
@@ -387,71 +527,188 @@ def generate_sample_data(variant: StudentVariant, output_path: Path, assignment_
         locations = variant.parameters.get('locations', ['Site-A', 'Site-B'])
         depth_range = variant.parameters.get('depth_range', {'min': 50, 'max': 500})
 
-        rock_types = ['Granite', 'Basalt', 'Sandstone', 'Schist', 'Gneiss']
+        lines = [",".join(SAMPLES_HEADER)]
+        for i in range(1, num_records + 1):
+            sample_id = f"GEO-{i:03d}"
+            rock = rng.choice(SAMPLE_ROCK_TYPES)
+            grade = round(rng.uniform(0.3, 5.0), 2)
+            depth = rng.randint(depth_range['min'], depth_range['max'])
+            mass = round(rng.uniform(8.0, 20.0), 1)
+            location = rng.choice(locations)
 
-        with open(output_path / 'samples.csv', 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['sample_id', 'rock_type', 'grade', 'depth', 'mass', 'location'])
+            lines.append(f"{sample_id},{rock},{grade},{depth},{mass},{location}")
 
-            for i in range(1, num_records + 1):
-                sample_id = f"GEO-{i:03d}"
-                rock = rng.choice(rock_types)
-                grade = round(rng.uniform(0.3, 5.0), 2)
-                depth = rng.randint(depth_range['min'], depth_range['max'])
-                mass = round(rng.uniform(8.0, 20.0), 1)
-                location = rng.choice(locations)
-
-                writer.writerow([sample_id, rock, grade, depth, mass, location])
+        _write_csv_lines(output_path / 'samples.csv', lines, batch_writer)
 
     elif assignment_type == 'ca02':
         # Generate geochemical assay data
         num_assays = variant.parameters.get('num_assays', 500)
 
-        lithologies = ['Granite', 'Basalt', 'Schist', 'Quartzite', 'Gneiss']
-        qualities = ['Good', 'Fair', 'Rejected']
+        # Inlined draws: randint(a, b) is a + _randbelow(b - a + 1), uniform(a, b)
+        # is a + (b - a) * random() and choice(seq) is seq[_randbelow(len(seq))].
+        # This is exactly what random.Random does internally, so the stream and
+        # every value are unchanged, but each draw costs one call instead of 2-3.
+        randbelow = rng._randbelow
+        rand = rng.random
+        num_lithologies = len(ASSAY_LITHOLOGIES)
+        num_qualities = len(ASSAY_QUALITIES)
+
+        lines = [",".join(ASSAYS_HEADER)]
+        for i in range(1, num_assays + 1):
+            sample_id = f"ASY-{i:04d}"
+            hole_id = ASSAY_HOLE_IDS[randbelow(5)]
+            from_depth = 10 + randbelow(441)
+            to_depth = from_depth + 1 + randbelow(4)
+            lithology = ASSAY_LITHOLOGIES[randbelow(num_lithologies)]
+
+            # Some missing values
+            au = round(0.01 + (6.0 - 0.01) * rand(), 3) if rand() > 0.05 else ''
+            cu = round(0.1 + (3.0 - 0.1) * rand(), 3) if rand() > 0.05 else ''
+            ag = round(1.0 + (15.0 - 1.0) * rand(), 2) if rand() > 0.05 else ''
+            fe = round(3.0 + (12.0 - 3.0) * rand(), 2)
+            s = round(0.2 + (4.5 - 0.2) * rand(), 2)
+            quality = ASSAY_QUALITIES[randbelow(num_qualities)]
+            date = f"{ASSAY_MONTHS[randbelow(12)]}-{ASSAY_DAYS[randbelow(28)]}"
+
+            lines.append(f"{sample_id},{hole_id},{from_depth},{to_depth},{lithology},"
+                         f"{au},{cu},{ag},{fe},{s},{quality},{date}")
+
+        _write_csv_lines(output_path / 'geochemical_assays.csv', lines, batch_writer)
+
+
+def _generate_sample_data_vectorized(
+    variant: StudentVariant,
+    output_path: Path,
+    assignment_type: str,
+    batch_writer: Optional[BatchWriter] = None
+):
+    """Generate the same CSV schemas as generate_sample_data with NumPy column draws."""
+    import numpy as np
+
+    rng = np.random.default_rng(variant.variant_seed)
+
+    def pick(options: List[Any], n: int) -> List[Any]:
+        # Same draws as rng.choice(options, size=n), but indexes the Python
+        # list with integer codes instead of building a NumPy string array
+        return [options[i] for i in rng.integers(0, len(options), size=n).tolist()]
 
-        with open(output_path / 'geochemical_assays.csv', 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['sample_id', 'hole_id', 'from_depth', 'to_depth', 'lithology',
-                           'Au_ppm', 'Cu_pct', 'Ag_ppm', 'Fe_pct', 'S_pct', 'sample_quality', 'assay_date'])
+    if assignment_type in ['lab04', 'lab05', 'ca01']:
+        n = variant.parameters.get('num_records', 50)
+        locations = variant.parameters.get('locations', ['Site-A', 'Site-B'])
+        depth_range = variant.parameters.get('depth_range', {'min': 50, 'max': 500})
 
-            for i in range(1, num_assays + 1):
-                sample_id = f"ASY-{i:04d}"
-                hole_id = f"DH-{rng.randint(1, 5):02d}"
-                from_depth = rng.randint(10, 450)
-                to_depth = from_depth + rng.randint(1, 4)
-                lithology = rng.choice(lithologies)
+        rows = zip(
+            [f"GEO-{i:03d}" for i in range(1, n + 1)],
+            pick(SAMPLE_ROCK_TYPES, n),
+            rng.uniform(0.3, 5.0, size=n).round(2).tolist(),
+            rng.integers(depth_range['min'], depth_range['max'] + 1, size=n).tolist(),
+            rng.uniform(8.0, 20.0, size=n).round(1).tolist(),
+            pick(locations, n),
+        )
 
-                # Some missing values
-                au = round(rng.uniform(0.01, 6.0), 3) if rng.random() > 0.05 else ''
-                cu = round(rng.uniform(0.1, 3.0), 3) if rng.random() > 0.05 else ''
-                ag = round(rng.uniform(1.0, 15.0), 2) if rng.random() > 0.05 else ''
-                fe = round(rng.uniform(3.0, 12.0), 2)
-                s = round(rng.uniform(0.2, 4.5), 2)
-                quality = rng.choice(qualities)
-                date = f"2024-{rng.randint(1,12):02d}-{rng.randint(1,28):02d}"
+        lines = [",".join(SAMPLES_HEADER)]
+        lines.extend(",".join(map(str, row)) for row in rows)
+        _write_csv_lines(output_path / 'samples.csv', lines, batch_writer)
 
-                writer.writerow([sample_id, hole_id, from_depth, to_depth, lithology,
-                               au, cu, ag, fe, s, quality, date])
+    elif assignment_type == 'ca02':
+        n = variant.parameters.get('num_assays', 500)
+
+        def with_missing(values: 'np.ndarray') -> List[Any]:
+            missing = rng.random(n) < 0.05
+            return ['' if m else v for v, m in zip(values.tolist(), missing.tolist())]
+
+        from_depth = rng.integers(10, 451, size=n)
+        months = pick(ASSAY_MONTHS, n)
+        days = pick(ASSAY_DAYS, n)
+
+        rows = zip(
+            [f"ASY-{i:04d}" for i in range(1, n + 1)],
+            pick(ASSAY_HOLE_IDS, n),
+            from_depth.tolist(),
+            (from_depth + rng.integers(1, 5, size=n)).tolist(),
+            pick(ASSAY_LITHOLOGIES, n),
+            with_missing(rng.uniform(0.01, 6.0, size=n).round(3)),
+            with_missing(rng.uniform(0.1, 3.0, size=n).round(3)),
+            with_missing(rng.uniform(1.0, 15.0, size=n).round(2)),
+            rng.uniform(3.0, 12.0, size=n).round(2).tolist(),
+            rng.uniform(0.2, 4.5, size=n).round(2).tolist(),
+            pick(ASSAY_QUALITIES, n),
+            [f"{m}-{d}" for m, d in zip(months, days)],
+        )
+
+        lines = [",".join(ASSAYS_HEADER)]
+        lines.extend(",".join(map(str, row)) for row in rows)
+        _write_csv_lines(output_path / 'geochemical_assays.csv', lines, batch_writer)
+
+
+def variant_to_dict(variant: StudentVariant) -> Dict[str, Any]:
+    """Convert a variant to a plain dict (shallow, unlike dataclasses.asdict)."""
+    parameters = variant.parameters
+    if any(isinstance(value, MappingProxyType) for value in parameters.values()):
+        # Read-only @group_only mappings are not JSON serializable as-is
+        parameters = {
+            name: dict(value) if isinstance(value, MappingProxyType) else value
+            for name, value in parameters.items()
+        }
+    return {
+        'student_id': variant.student_id,
+        'variant_seed': variant.variant_seed,
+        'group_id': variant.group_id,
+        'parameters': parameters,
+    }
 
 
 def generate_variant_config_file(variant: StudentVariant) -> str:
     """Generate a JSON config file for tests to read."""
-    return json.dumps(asdict(variant), indent=2)
-
-
-def generate_student_readme(variant: StudentVariant, template: str) -> str:
-    """Generate personalized README for a student."""
-    content = template
-    for param_name, param_value in variant.parameters.items():
-        placeholder = f"{{{param_name}}}"
-        if isinstance(param_value, list):
-            value_str = ", ".join(str(v) for v in param_value)
-        elif isinstance(param_value, dict):
-            value_str = json.dumps(param_value)
-        else:
-            value_str = str(param_value)
-        content = content.replace(placeholder, value_str)
+    return json.dumps(variant_to_dict(variant), indent=2)
+
+
+def _format_param_value(param_value: Any) -> str:
+    """Format a parameter value for substitution into a README."""
+    if isinstance(param_value, (list, tuple)):
+        return ", ".join(str(v) for v in param_value)
+    if isinstance(param_value, (dict, MappingProxyType)):
+        return json.dumps(dict(param_value))
+    return str(param_value)
+
+
+class ReadmeRenderer:
+    """
+    Fill a README template's {param} placeholders for many students.
+
+    The placeholder names are fixed per assignment, so the substitution
+    pattern is compiled once and only the template and values are passed
+    per render.
+    """
+
+    def __init__(self, param_names: Iterable[str]):
+        names = list(param_names)
+        self._pattern = (
+            re.compile(r"\{(" + "|".join(map(re.escape, names)) + r")\}") if names else None
+        )
+
+    def render(self, template: str, parameters: Mapping[str, Any]) -> str:
+        """Return template with each placeholder replaced by its formatted value."""
+        if self._pattern is None:
+            return template
+        values = {name: _format_param_value(value) for name, value in parameters.items()}
+        return self._pattern.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
+def generate_student_readme(
+    variant: StudentVariant,
+    template: str,
+    renderer: Optional[ReadmeRenderer] = None
+) -> str:
+    """
+    Generate personalized README for a student.
+
+    Pass a ReadmeRenderer built once for the assignment when rendering a
+    whole class; otherwise one is built from this variant's parameters.
+    """
+    if renderer is None:
+        renderer = ReadmeRenderer(variant.parameters)
+    content = renderer.render(template, variant.parameters)
 
     # Add variant metadata as HTML comment
     metadata = f"""<!--
@@ -462,7 +719,7 @@ Group: {variant.group_id}
 Generated: AUTO
 DO NOT MODIFY THIS COMMENT
 -->"""
-    return metadata + "\n\n" + content
+    return f"{metadata}\n\n{content}"
 
 
 # ============================================================================
@@ -482,6 +739,48 @@ ASSIGNMENT_GENERATORS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def get_assignment_generators(assignment_id: str) -> Mapping[str, Callable]:
+    """Return the (cached, read-only) parameter generators for an assignment."""
+    return MappingProxyType(ASSIGNMENT_GENERATORS[assignment_id]())
+
+
+def _generate_variant_task(config: VariantConfig, student_id: str, seed: int) -> StudentVariant:
+    """Worker entry point for generate_assignment_batch (generators are rebuilt per process)."""
+    param_generators = get_assignment_generators(config.assignment_id)
+    return VariantGenerator(config).generate_variant(student_id, param_generators, seed=seed)
+
+
+def generate_assignment_batch(
+    config: VariantConfig,
+    student_ids: List[str],
+    max_workers: Optional[int] = None
+) -> List[StudentVariant]:
+    """
+    Generate variants for a whole class across worker processes.
+
+    Every student already has an independent seed derived from their ID,
+    so results are identical to VariantGenerator.generate_batch regardless
+    of how the students are split between workers.
+
+    Args:
+        config: Variant configuration (its assignment_id selects the generators)
+        student_ids: Student IDs or GitHub usernames
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        List of StudentVariant in the same order as student_ids
+    """
+    seeds = VariantGenerator(config)._compute_seeds_batch(student_ids)
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(student_ids) // (4 * max_workers))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            _generate_variant_task, repeat(config), student_ids, seeds, chunksize=chunksize
+        ))
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -503,6 +802,8 @@ if __name__ == "__main__":
                         choices=['json', 'config'])
     parser.add_argument("--output-dir", type=Path, default=None,
                         help="Directory to write generated data files")
+    parser.add_argument("--fast", action="store_true",
+                        help="Generate data files with NumPy (values differ from the default)")
 
     args = parser.parse_args()
 
@@ -513,17 +814,19 @@ if __name__ == "__main__":
     )
 
     generator = VariantGenerator(config)
-    param_generators = ASSIGNMENT_GENERATORS[args.assignment]()
+    param_generators = get_assignment_generators(args.assignment)
     variant = generator.generate_variant(args.student, param_generators)
 
     if args.output == 'json':
-        print(json.dumps(asdict(variant), indent=2))
+        print(json.dumps(variant_to_dict(variant), indent=2))
     elif args.output == 'config':
         print(generate_variant_config_file(variant))
 
     if args.output_dir:
         args.output_dir.mkdir(parents=True, exist_ok=True)
-        generate_sample_data(variant, args.output_dir, args.assignment)
-        with open(args.output_dir / '.variant_config.json', 'w') as f:
-            f.write(generate_variant_config_file(variant))
+        with BatchWriter() as batch_writer:
+            generate_sample_data(variant, args.output_dir, args.assignment,
+                                 fast=args.fast, batch_writer=batch_writer)
+            batch_writer.submit_write(args.output_dir / '.variant_config.json',
+                                      generate_variant_config_file(variant).encode())
         print(f"Data files generated in: {args.output_dir}")
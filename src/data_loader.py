@@ -6,17 +6,29 @@ This module provides functions to:
 - Load geological prospect data from CSV files
 - Validate data quality and identify issues
 - Clean data by removing invalid records and handling missing values
+
+load_prospect_data() and clean_data() return DataFrames that can be passed
+straight to the processor module; validate_data() returns a report
+dictionary and get_data_summary() a text summary. The validation and
+cleaning checks work best as boolean masks over whole columns rather than
+loops over rows.
 """
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
-def load_prospect_data(filepath: str) -> pd.DataFrame:
+def load_prospect_data(
+    filepath: str,
+    usecols: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
     Load CSV data and return a DataFrame.
 
     Args:
         filepath: Path to the CSV file containing prospect data
+        usecols: Optional list of column names to load. Columns not listed
+                 are skipped while parsing, so every later stage works on a
+                 narrower DataFrame. Default None loads all columns.
 
     Returns:
         DataFrame containing the raw geological data
@@ -32,6 +44,10 @@ def load_prospect_data(filepath: str) -> pd.DataFrame:
     """
     # TODO: Implement this function
     # Hint: Use pd.read_csv() to load the data
+    # Hint: Passing dtype= for the numeric columns (e.g. {'grade': 'float64',
+    #       'mass': 'float64', 'volume': 'float64'}) saves pandas from
+    #       guessing their types; leave the text columns as plain strings
+    # Hint: Pass usecols straight through to pd.read_csv(usecols=usecols)
     pass
 
 
@@ -65,6 +81,12 @@ def validate_data(df: pd.DataFrame) -> Dict[str, Any]:
     # TODO: Implement validation logic
     # Hint: Use df.isnull().sum() for missing values
     # Hint: Use boolean indexing to count invalid values
+    # Hint: Build the invalid-grade and invalid-depth masks once and reuse
+    #       them: .sum() on a mask gives its count, and combining the two
+    #       masks with | gives every row that fails a check
+    # Hint: Pulling each column out once with df['grade'].to_numpy() and
+    #       counting with np.count_nonzero(mask) avoids building extra
+    #       pandas Series for every intermediate step
     pass
 
 
@@ -93,9 +115,15 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
         Records before: 300, after: 290
     """
     # TODO: Implement cleaning logic
-    # Hint: Use df.copy() to avoid modifying the original
+    # Hint: Build one boolean mask of the rows to keep and index with
+    #       df.loc[mask] - this already returns a new DataFrame, so there is
+    #       no need to df.copy() the whole input first
+    # Hint: Write the mask as ~(df['grade'] < 0) rather than df['grade'] >= 0
+    #       so rows with a missing value are kept and can be filled below
     # Hint: Use df.drop_duplicates() for removing duplicates
-    # Hint: Use df.fillna() with df.median() for filling missing values
+    # Hint: Use df.fillna() with the column medians for filling missing
+    #       values - compute the medians once from the kept rows and pass
+    #       that Series to fillna()
     pass
 
 
@@ -118,5 +146,7 @@ def get_data_summary(df: pd.DataFrame) -> str:
         - Grade range: 0.12 - 8.45 g/t
     """
     # TODO: Implement summary generation
+    # Hint: df['grade'].agg(['min', 'max']) computes both values in one call
+    # Hint: Build the lines in a list and join them with '\n'
     # This is an optional helper function
     pass
@@ -6,6 +6,10 @@ This module provides functions to:
 - Calculate derived values (density, intervals)
 - Classify samples based on grade thresholds
 - Filter data by various criteria
+
+Each function takes a DataFrame and returns a new one with a column added
+or rows removed; compute the new columns with column arithmetic rather
+than apply() or row loops.
 """
 import pandas as pd
 from typing import List, Optional
@@ -62,7 +66,14 @@ def classify_grade(df: pd.DataFrame, cutoff: float) -> pd.DataFrame:
     """
     # TODO: Implement grade classification
     # Hint: Use pd.cut() or np.where() for classification
-    # Hint: Consider using a function with apply() for custom logic
+    # Hint: Avoid apply() here - it calls a Python function once per row;
+    #       compare the whole 'grade' column against cutoff and 2 * cutoff
+    # Hint: pd.cut() already returns a categorical column; with np.where()
+    #       you can convert the result with .astype('category')
+    # Hint: np.searchsorted([cutoff, 2 * cutoff], grades, side='right') gives
+    #       0, 1 or 2 for every grade at once - use it to index a list of labels
+    #       (NaN sorts last, so a missing grade would get 2 / 'High Grade';
+    #       drop or fill missing grades first, e.g. with clean_data())
     pass
 
 
@@ -107,6 +118,9 @@ def filter_by_drillhole(df: pd.DataFrame, hole_ids: Optional[List[str]]) -> pd.D
     """
     # TODO: Implement drillhole filtering
     # Hint: Use df[df['hole_id'].isin(hole_ids)]
+    # Hint: isin() scans the whole column on every call - if you need each
+    #       drillhole separately, loop over df.groupby('hole_id', sort=False)
+    #       once instead of calling this function per hole
     pass
 
 
@@ -131,6 +145,8 @@ def filter_by_depth_range(
         >>> print(f"Depth range: {filtered['from_depth'].min()} - {filtered['from_depth'].max()}")
     """
     # TODO: Implement depth filtering
+    # Hint: Start from a mask that keeps every row, narrow it with & for each
+    #       bound that is not None, then index df once with the final mask
     # This is an optional helper function
     pass
 
@@ -158,3 +174,29 @@ def calculate_grade_thickness(df: pd.DataFrame) -> pd.DataFrame:
     # TODO: Implement grade-thickness calculation
     # This is an optional helper function
     pass
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add 'density', 'interval' and 'grade_thickness' columns in one step.
+
+    Equivalent to calling calculate_density(), calculate_intervals() and
+    calculate_grade_thickness() in turn, but builds all three columns in
+    a single operation instead of three separate DataFrame copies.
+
+    Args:
+        df: DataFrame with 'mass', 'volume', 'from_depth', 'to_depth'
+            and 'grade' columns
+
+    Returns:
+        DataFrame with 'density', 'interval' and 'grade_thickness' columns added
+
+    Example:
+        >>> df = add_derived_columns(df)
+        >>> print(df[['density', 'interval', 'grade_thickness']].head())
+    """
+    # TODO: Implement combined derived-column calculation
+    # Hint: df.assign() can add several columns at once, and a later column
+    #       can use an earlier one: grade_thickness=lambda d: d['grade'] * d['interval']
+    # This is an optional helper function
+    pass
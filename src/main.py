@@ -76,17 +76,33 @@ def run_pipeline(config: Dict[str, Any]) -> Dict[str, Any]:
     #
     # Stage 1: Load and validate data
     # - Use load_prospect_data() to load the CSV
+    # - If your data file has extra columns the pipeline never uses, pass
+    #   usecols= with the columns you need so they are skipped while parsing
     # - Use validate_data() to check data quality
     # - Print validation summary
     #
     # Stage 2: Clean data
     # - Use clean_data() to remove invalid records
     # - Optionally filter by drillholes if specified
+    # - Filter here, before Stage 3, so the derived columns are only
+    #   calculated for the rows you will actually analyze
+    # - If you apply more than one filter (e.g. drillholes and a depth
+    #   range), combine the boolean masks with & and index df once
     #
     # Stage 3: Process data
     # - Use calculate_density() to add density column
     # - Use classify_grade() with target_grade cutoff
     # - Use calculate_intervals() to add interval column
+    # - (Optional) add_derived_columns() adds density, interval and
+    #   grade_thickness together in one step
+    # - Reassign one variable as you go (df = calculate_density(df)) rather
+    #   than keeping every intermediate DataFrame alive
+    # - (Optional) Cache the processed DataFrame with df.to_parquet() under
+    #   output_dir, named after the input file's size, modification time,
+    #   target_grade and drillholes, and reload it with pd.read_parquet() to
+    #   skip Stages 1-3 on re-runs (needs pyarrow; keep the validation report
+    #   with it) - the cached frame is already filtered, so a different
+    #   drillholes setting must not reuse it
     #
     # Stage 4: Analyze data
     # - Use summary_statistics() for key numeric columns
@@ -100,6 +116,11 @@ def run_pipeline(config: Dict[str, Any]) -> Dict[str, Any]:
     # - Use plot_depth_vs_grade()
     # - Use plot_grade_by_drillhole()
     # - Use plot_correlation_heatmap()
+    # - Optional: the four plots do not depend on each other, so for large
+    #   datasets you can submit them to a
+    #   concurrent.futures.ProcessPoolExecutor and call .result() on each
+    #   future (this only pays off when each plot takes longer than
+    #   starting a worker process)
     #
     # Stage 6: Generate report
     # - Use generate_summary_report() to create markdown report
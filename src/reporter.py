@@ -51,6 +51,12 @@ def generate_summary_report(
     # TODO: Implement report generation
     # Hint: Use f-strings and triple-quoted strings for markdown formatting
     # Hint: Include sections for validation, statistics, and recommendations
+    # Hint: Collect the sections in a list and combine them once with
+    #       '\n'.join(sections) instead of growing one string with +=
+    # Hint: The fixed layout can also live in one module-level template
+    #       string (e.g. REPORT_TEMPLATE = """# {project_name} - ...""")
+    #       filled in with REPORT_TEMPLATE.format(...) - build the
+    #       statistics table with format_statistics_table() and pass it in
     pass
 
 
@@ -70,6 +76,8 @@ def save_report(content: str, output_path: str) -> None:
     """
     # TODO: Implement file writing
     # Hint: Use open() with 'w' mode and write()
+    # Hint: Pass encoding='utf-8' and write the whole content in one
+    #       f.write(content) call
     pass
 
 
@@ -92,6 +100,9 @@ def export_processed_data(df: pd.DataFrame, output_path: str) -> None:
     """
     # TODO: Implement CSV export
     # Hint: Use df.to_csv() with index=False
+    # Hint: (Optional) If pyarrow is installed, also saving
+    #       df.to_parquet(...) gives a smaller file that reloads much faster
+    #       than the CSV; the CSV is still required
     pass
 
 
@@ -139,6 +150,8 @@ def format_statistics_table(stats: pd.DataFrame) -> str:
     """
     # TODO: Implement table formatting
     # Hint: Use stats.to_markdown() if available, or format manually
+    # Hint: When formatting manually, build one string per table row in a
+    #       list and return '\n'.join(rows) - avoid iterrows() and repeated +=
     # This is an optional helper function
     pass
 
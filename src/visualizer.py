@@ -9,6 +9,8 @@ This module provides functions to:
 - Create correlation heatmaps
 """
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render straight to image files; no GUI window needed
 import matplotlib.pyplot as plt
 from typing import Optional, Tuple
 
@@ -41,6 +43,11 @@ def plot_grade_histogram(
     # TODO: Implement histogram plotting
     # Hint: Use plt.figure(), plt.hist(), plt.xlabel(), plt.ylabel(), plt.title()
     # Hint: Use plt.savefig(output_path) and plt.close()
+    # Hint: Drop missing grades first with df['grade'].dropna()
+    # Hint: plt.hist() draws one rectangle per bin; histtype='stepfilled'
+    #       draws a single shape instead, or bin the values yourself with
+    #       counts, edges = np.histogram(grades, bins=bins) and draw them
+    #       with ax.stairs(counts, edges, fill=True)
     pass
 
 
@@ -73,6 +80,9 @@ def plot_depth_vs_grade(
     # TODO: Implement scatter plot
     # Hint: Use plt.scatter()
     # Hint: Use plt.gca().invert_yaxis() to flip depth axis
+    # Hint: Passing rasterized=True to plt.scatter() draws the points as one
+    #       image instead of one shape per sample, which saves much faster
+    # Hint: Call plt.close() after plt.savefig() to free the figure
     pass
 
 
@@ -100,7 +110,9 @@ def plot_grade_by_drillhole(
     """
     # TODO: Implement box plot
     # Hint: Use df.boxplot() or plt.boxplot()
-    # Hint: Group data by 'hole_id' first
+    # Hint: Group data by 'hole_id' first - a single
+    #       df.groupby('hole_id', sort=False)['grade'] pass gives every hole's
+    #       values without filtering the DataFrame once per hole
     pass
 
 
@@ -214,5 +226,8 @@ def create_summary_dashboard(
     """
     # TODO: Implement dashboard
     # Hint: Use plt.subplots(2, 2, figsize=figsize)
+    # Hint: Draw each panel directly on its axes (e.g. axes[0, 0].hist(...))
+    #       rather than calling the plot_* functions, which would each build
+    #       and save a separate figure; then save the dashboard once
     # This is an optional helper function
     pass
@@ -0,0 +1,91 @@
+"""
+Tests for scripts/variant_generator.py (instructor tooling, not graded).
+"""
+import json
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
+
+from variant_generator import (
+    ReadmeRenderer, VariantConfig, VariantGenerator, generate_variant_config_file, group_only
+)
+
+
+STUDENTS = [f'student{i:02d}' for i in range(30)]
+
+
+@group_only
+def group_holes(rng, group_id):
+    """Group-level value that does not draw from rng."""
+    return (f'DH-{group_id:02d}', f'DH-{group_id + 1:02d}')
+
+
+@group_only
+def grade_bands(rng, group_id):
+    """Group-level mapping, returned read-only so it can be shared."""
+    return MappingProxyType({'low': 1.0 + group_id, 'high': 2.0 + group_id})
+
+
+def target_grade(rng, group_id):
+    """Per-student value drawn from rng."""
+    return round(rng.uniform(1.0, 5.0), 2)
+
+
+GENERATORS = {'holes': group_holes, 'bands': grade_bands, 'target_grade': target_grade}
+
+
+class TestGroupOnly:
+    """Tests for the @group_only memo used by generate_batch."""
+
+    def test_batch_matches_individual_variants(self):
+        """Memoizing a group_only generator must not change values or the rng stream."""
+        generator = VariantGenerator(VariantConfig('lab06', 'grouped', num_groups=3))
+
+        batch = generator.generate_batch(STUDENTS, GENERATORS)
+        individual = [generator.generate_variant(sid, GENERATORS) for sid in STUDENTS]
+
+        assert [v.parameters for v in batch] == [v.parameters for v in individual]
+
+    def test_group_members_share_one_immutable_value(self):
+        """Students in a group share the memoized values, which still serialize to JSON."""
+        generator = VariantGenerator(VariantConfig('lab06', 'grouped', num_groups=3))
+
+        batch = generator.generate_batch(STUDENTS, GENERATORS)
+        first = batch[0]
+        same_group = [v for v in batch[1:] if v.group_id == first.group_id]
+        assert same_group, "Expected at least two students in one group"
+
+        for variant in same_group:
+            assert variant.parameters['holes'] is first.parameters['holes']
+            assert variant.parameters['bands'] is first.parameters['bands']
+
+        config = json.loads(generate_variant_config_file(first))
+        assert config['parameters']['holes'] == list(first.parameters['holes'])
+        assert config['parameters']['bands'] == dict(first.parameters['bands'])
+
+    def test_mutable_group_only_value_is_rejected(self):
+        """A @group_only generator returning a list would leak edits across a group."""
+        @group_only
+        def mutable_holes(rng, group_id):
+            return [f'DH-{group_id:02d}']
+
+        generator = VariantGenerator(VariantConfig('lab06', 'grouped', num_groups=3))
+
+        with pytest.raises(TypeError):
+            generator.generate_batch(STUDENTS, {'holes': mutable_holes})
+
+
+class TestReadmeRenderer:
+    """Tests for the reusable README renderer."""
+
+    def test_renders_the_template_it_is_given(self):
+        """One renderer must fill whichever template is passed to render()."""
+        renderer = ReadmeRenderer(['project_name'])
+        parameters = {'project_name': 'Zinc Creek Project'}
+
+        assert renderer.render('# {project_name}', parameters) == '# Zinc Creek Project'
+        assert renderer.render('Project: {project_name}', parameters) == 'Project: Zinc Creek Project'
@@ -2,89 +2,193 @@
 Pytest Configuration for GGY3601 Lab 6: Integration Project
 Provides fixtures and configuration for testing the complete pipeline.
 """
+import matplotlib
+# Use the non-interactive backend before anything imports pyplot, so the
+# visualizer tests never probe for a GUI backend or open windows
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
 import pytest
 import pandas as pd
 import numpy as np
+import hashlib
+import io
 import os
 import sys
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+# Add src directory to path for imports (once, even if conftest is re-imported)
+SRC_DIR = str(Path(__file__).parent.parent.parent / 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
+PROSPECT_DATA_PATH = Path(__file__).parent.parent.parent / 'data' / 'prospect_data.csv'
 
-@pytest.fixture
-def sample_dataframe():
-    """Create a sample DataFrame for testing."""
-    np.random.seed(42)
-    n_samples = 50
+
+def pytest_configure(config):
+    """Register the custom marks used by the visible tests."""
+    config.addinivalue_line(
+        'markers', 'integration: tests that read the real data/prospect_data.csv file'
+    )
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_up_matplotlib():
+    """Render one small figure up front so font loading is paid once per session."""
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    ax.set_title('warm-up')
+    fig.savefig(io.BytesIO(), format='png')
+    plt.close(fig)
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close any figures a test leaves open so they do not pile up."""
+    yield
+    plt.close('all')
+
+
+def _seed_for(name):
+    """Derive a stable 64-bit RNG seed from a dataset name."""
+    return int.from_bytes(hashlib.md5(name.encode('utf-8')).digest()[:8], 'big')
+
+
+@lru_cache(maxsize=None)
+def _make_geo_df(n_samples, name):
+    """Build a random geological sample DataFrame, once per (size, name) pair.
+
+    Each name gets its own reproducible random stream, so new datasets can
+    be added without changing the existing ones.
+    """
+    # A local Generator keeps the data reproducible without touching the
+    # global NumPy random state other tests might rely on
+    rng = np.random.default_rng(_seed_for(name))
+
+    # Keep this draw order; reordering changes the generated data
+    hole_id = rng.choice(['DH-01', 'DH-02', 'DH-03', 'DH-04'], n_samples)
+    from_depth = rng.uniform(10, 400, n_samples).round(1)
+    lithology = rng.choice(['Granite', 'Schist', 'Quartzite', 'Basalt'], n_samples)
+    grade = rng.uniform(0.1, 6.0, n_samples).round(2)
+    mass = rng.uniform(8.0, 20.0, n_samples).round(1)
+    volume = rng.uniform(3.0, 8.0, n_samples).round(1)
+    # to_depth is from_depth plus a random interval
+    to_depth = from_depth + rng.uniform(0.5, 2.5, n_samples).round(1)
 
     data = {
         'sample_id': [f'GEO-{i:04d}' for i in range(1, n_samples + 1)],
-        'hole_id': np.random.choice(['DH-01', 'DH-02', 'DH-03', 'DH-04'], n_samples),
-        'from_depth': np.random.uniform(10, 400, n_samples).round(1),
-        'to_depth': None,  # Will be calculated
-        'lithology': np.random.choice(['Granite', 'Schist', 'Quartzite', 'Basalt'], n_samples),
-        'grade': np.random.uniform(0.1, 6.0, n_samples).round(2),
-        'mass': np.random.uniform(8.0, 20.0, n_samples).round(1),
-        'volume': np.random.uniform(3.0, 8.0, n_samples).round(1),
+        'hole_id': hole_id,
+        'from_depth': from_depth,
+        'to_depth': to_depth,
+        'lithology': lithology,
+        'grade': grade,
+        'mass': mass,
+        'volume': volume,
     }
 
     df = pd.DataFrame(data)
-    # Calculate to_depth as from_depth + random interval
-    df['to_depth'] = df['from_depth'] + np.random.uniform(0.5, 2.5, n_samples).round(1)
-
     return df
 
 
-@pytest.fixture
-def sample_dataframe_with_issues():
-    """Create a DataFrame with data quality issues for validation testing."""
+@lru_cache(maxsize=1)
+def _build_sample_dataframe_with_issues():
+    """Build the DataFrame with data quality issues once per test session."""
     data = {
         'sample_id': ['GEO-001', 'GEO-002', 'GEO-003', 'GEO-004', 'GEO-005',
                       'GEO-006', 'GEO-007', 'GEO-008', 'GEO-001', 'GEO-010'],  # Duplicate ID
         'hole_id': ['DH-01', 'DH-01', 'DH-02', 'DH-02', 'DH-03',
                     'DH-03', 'DH-04', 'DH-04', 'DH-01', 'DH-05'],
-        'from_depth': [10.0, 15.5, -5.0, 25.0, 30.0,  # Negative depth
-                       35.0, None, 45.0, 50.0, 55.0],  # Missing value
-        'to_depth': [12.0, 17.5, -3.0, 27.0, 32.0,
-                     37.0, 42.5, 47.0, 52.0, 57.0],
+        # Numeric columns are float64 arrays with np.nan for missing values,
+        # so pandas does not have to infer dtypes from lists containing None
+        'from_depth': np.array([10.0, 15.5, -5.0, 25.0, 30.0,  # Negative depth
+                                35.0, np.nan, 45.0, 50.0, 55.0]),  # Missing value
+        'to_depth': np.array([12.0, 17.5, -3.0, 27.0, 32.0,
+                              37.0, 42.5, 47.0, 52.0, 57.0]),
         'lithology': ['Granite', 'Schist', 'Quartzite', 'Basalt', 'Granite',
                       None, 'Schist', 'Quartzite', 'Basalt', 'Granite'],  # Missing
-        'grade': [2.5, -0.5, 3.2, None, 4.1,  # Negative and missing
-                  1.8, 150.0, 2.9, 3.5, 0.8],  # Invalid > 100
-        'mass': [12.5, 15.0, 11.0, 14.5, 13.0,
-                 None, 16.0, 12.0, 15.5, 14.0],  # Missing
-        'volume': [5.0, 6.0, 4.5, 5.5, 5.2,
-                   4.8, 6.5, 4.8, 6.0, 5.5],
+        'grade': np.array([2.5, -0.5, 3.2, np.nan, 4.1,  # Negative and missing
+                           1.8, 150.0, 2.9, 3.5, 0.8]),  # Invalid > 100
+        'mass': np.array([12.5, 15.0, 11.0, 14.5, 13.0,
+                          np.nan, 16.0, 12.0, 15.5, 14.0]),  # Missing
+        'volume': np.array([5.0, 6.0, 4.5, 5.5, 5.2,
+                            4.8, 6.5, 4.8, 6.0, 5.5]),
     }
     return pd.DataFrame(data)
 
 
 @pytest.fixture
-def sample_csv_file(sample_dataframe, tmp_path):
-    """Create a temporary CSV file for testing."""
-    csv_path = tmp_path / 'test_data.csv'
-    sample_dataframe.to_csv(csv_path, index=False)
-    return str(csv_path)
+def sample_dataframe():
+    """Create a sample DataFrame for testing."""
+    # Each test gets its own copy so in-place changes cannot leak between tests
+    return _make_geo_df(50, 'sample_dataframe').copy()
 
 
 @pytest.fixture
-def sample_csv_with_issues(sample_dataframe_with_issues, tmp_path):
-    """Create a temporary CSV file with data issues for testing."""
-    csv_path = tmp_path / 'test_data_issues.csv'
-    sample_dataframe_with_issues.to_csv(csv_path, index=False)
+def sample_dataframe_with_issues():
+    """Create a DataFrame with data quality issues for validation testing."""
+    return _build_sample_dataframe_with_issues().copy()
+
+
+def _to_csv_bytes(df):
+    """Serialize a DataFrame to CSV bytes in one pass."""
+    # All fixture values have at most 3 decimals, so a fixed float format
+    # skips pandas' slower shortest-repr float formatting without losing data
+    return df.to_csv(index=False, float_format='%.3f', lineterminator='\n').encode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def _sample_csv_bytes():
+    """Serialize the sample DataFrame to CSV bytes once per test session."""
+    return _to_csv_bytes(_make_geo_df(50, 'sample_dataframe'))
+
+
+@pytest.fixture(scope='session')
+def sample_csv_file(tmp_path_factory):
+    """Create a temporary CSV file for testing (written once per session)."""
+    csv_path = tmp_path_factory.mktemp('data') / 'test_data.csv'
+    csv_path.write_bytes(_sample_csv_bytes())
     return str(csv_path)
 
 
+@pytest.fixture(scope='session')
+def sample_csv_with_issues(tmp_path_factory):
+    """Create a temporary CSV file with data issues for testing (written once per session)."""
+    csv_path = tmp_path_factory.mktemp('data') / 'test_data_issues.csv'
+    csv_path.write_bytes(_to_csv_bytes(_build_sample_dataframe_with_issues()))
+    return str(csv_path)
+
+
+@pytest.fixture(scope='session')
+def sample_feather_file(tmp_path_factory):
+    """Create a temporary Feather file for tests that only need the data, not CSV parsing."""
+    # Feather support comes from pyarrow, which is not a required lab package
+    pytest.importorskip('pyarrow')
+    feather_path = tmp_path_factory.mktemp('data') / 'test_data.feather'
+    _make_geo_df(50, 'sample_dataframe').reset_index(drop=True).to_feather(feather_path)
+    return str(feather_path)
+
+
 @pytest.fixture
-def temp_output_dir(tmp_path):
-    """Create a temporary output directory for testing."""
-    output_dir = tmp_path / 'output'
-    output_dir.mkdir()
-    return str(output_dir)
+def sample_csv_buffer():
+    """Create an in-memory CSV buffer for tests that only need to parse CSV text."""
+    # A fresh BytesIO per test, so each test starts reading at position 0
+    return io.BytesIO(_sample_csv_bytes())
+
+
+@pytest.fixture(scope='session')
+def output_root(tmp_path_factory):
+    """Create one base directory for all test output in the session."""
+    return tmp_path_factory.mktemp('output')
+
+
+@pytest.fixture
+def temp_output_dir(output_root):
+    """Create a temporary output directory for testing, as a Path."""
+    # A fresh subdirectory per test, so a test can never pass because an
+    # earlier test already wrote the file it is checking for
+    return Path(tempfile.mkdtemp(dir=output_root))
 
 
 @pytest.fixture
@@ -128,12 +232,11 @@ def sample_validation_report():
     }
 
 
-@pytest.fixture
-def pipeline_config(sample_csv_file, temp_output_dir):
-    """Create sample pipeline configuration for testing."""
+def _make_pipeline_config(input_file, output_dir):
+    """Build the pipeline configuration shared by the pipeline fixtures."""
     return {
-        'input_file': sample_csv_file,
-        'output_dir': temp_output_dir,
+        'input_file': input_file,
+        'output_dir': output_dir,
         'project_name': 'Test Project',
         'target_grade': 2.0,
         'drillholes': None
@@ -141,9 +244,39 @@ def pipeline_config(sample_csv_file, temp_output_dir):
 
 
 @pytest.fixture
+def pipeline_config(sample_csv_file, temp_output_dir):
+    """Create sample pipeline configuration for testing."""
+    return _make_pipeline_config(sample_csv_file, str(temp_output_dir))
+
+
+@pytest.fixture(scope='class')
+def shared_pipeline_config(sample_csv_file, output_root):
+    """Create a pipeline configuration shared by one test class."""
+    return _make_pipeline_config(sample_csv_file, tempfile.mkdtemp(dir=output_root))
+
+
+@pytest.fixture(scope='class')
+def pipeline_result(shared_pipeline_config):
+    """Run the pipeline once per test class for tests that only inspect its result."""
+    from main import run_pipeline
+
+    return run_pipeline(shared_pipeline_config)
+
+
+@pytest.fixture(scope='session')
 def prospect_data_path():
     """Return path to the actual prospect_data.csv file."""
-    return str(Path(__file__).parent.parent.parent / 'data' / 'prospect_data.csv')
+    return str(PROSPECT_DATA_PATH)
+
+
+@pytest.fixture(scope='session')
+def prospect_dataframe(prospect_data_path):
+    """Load prospect_data.csv once per session.
+
+    The same DataFrame is shared by every test that uses it, so tests must
+    only read from it.
+    """
+    return pd.read_csv(prospect_data_path)
 
 
 # Helper functions for tests
@@ -14,11 +14,26 @@ import pytest
 import pandas as pd
 import numpy as np
 import os
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+# src/ is put on sys.path once by conftest.py, which pytest loads first
+
+PROSPECT_DATA_PATH = Path(__file__).parents[2] / 'data' / 'prospect_data.csv'
+
+# Required column/key sets, checked with one set difference per test
+LOADED_COLUMNS = frozenset({'sample_id', 'hole_id', 'grade', 'from_depth', 'to_depth'})
+VALIDATION_KEYS = frozenset({'total_records', 'valid_records', 'missing_values',
+                             'invalid_grades', 'invalid_depths'})
+PIPELINE_KEYS = frozenset({'validation', 'statistics', 'high_grade_count', 'output_files'})
+PROSPECT_COLUMNS = frozenset({'sample_id', 'hole_id', 'from_depth', 'to_depth',
+                              'lithology', 'grade', 'mass', 'volume'})
+
+
+def assert_is_dataframe(result, non_empty=False):
+    """Assert that a function returned a DataFrame, optionally with rows."""
+    assert isinstance(result, pd.DataFrame), "Should return a DataFrame"
+    if non_empty:
+        assert len(result) > 0, "DataFrame should not be empty"
 
 
 # ============================================================================
@@ -34,18 +49,16 @@ class TestDataLoader:
 
         result = load_prospect_data(sample_csv_file)
 
-        assert isinstance(result, pd.DataFrame), "Should return a DataFrame"
-        assert len(result) > 0, "DataFrame should not be empty"
+        assert_is_dataframe(result, non_empty=True)
 
     def test_load_prospect_data_has_required_columns(self, sample_csv_file):
         """Test that loaded data has expected columns."""
         from data_loader import load_prospect_data
 
         result = load_prospect_data(sample_csv_file)
-        required_columns = ['sample_id', 'hole_id', 'grade', 'from_depth', 'to_depth']
+        missing = LOADED_COLUMNS - set(result.columns)
 
-        for col in required_columns:
-            assert col in result.columns, f"Missing required column: {col}"
+        assert not missing, f"Missing required columns: {sorted(missing)}"
 
     def test_load_prospect_data_file_not_found(self):
         """Test that FileNotFoundError is raised for missing file."""
@@ -67,11 +80,9 @@ class TestDataLoader:
         from data_loader import validate_data
 
         result = validate_data(sample_dataframe)
-        required_keys = ['total_records', 'valid_records', 'missing_values',
-                        'invalid_grades', 'invalid_depths']
+        missing = VALIDATION_KEYS - result.keys()
 
-        for key in required_keys:
-            assert key in result, f"Missing required key: {key}"
+        assert not missing, f"Missing required keys: {sorted(missing)}"
 
     def test_validate_data_detects_issues(self, sample_dataframe_with_issues):
         """Test that validation detects data quality issues."""
@@ -89,7 +100,7 @@ class TestDataLoader:
 
         result = clean_data(sample_dataframe_with_issues)
 
-        assert isinstance(result, pd.DataFrame), "Should return a DataFrame"
+        assert_is_dataframe(result)
 
     def test_clean_data_removes_invalid_grades(self, sample_dataframe_with_issues):
         """Test that clean_data removes records with invalid grades."""
@@ -134,11 +145,11 @@ class TestDataProcessor:
 
         result = calculate_density(sample_dataframe)
 
-        # Check a few values manually
-        for idx in result.index[:5]:
-            expected = result.loc[idx, 'mass'] / result.loc[idx, 'volume']
-            actual = result.loc[idx, 'density']
-            assert abs(actual - expected) < 0.001, "Density calculation incorrect"
+        # Check every row against mass / volume
+        expected = result['mass'].to_numpy() / result['volume'].to_numpy()
+        actual = result['density'].to_numpy()
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=0.001,
+                                   err_msg="Density calculation incorrect")
 
     def test_classify_grade_adds_column(self, sample_dataframe):
         """Test that classify_grade adds grade_class column."""
@@ -156,16 +167,13 @@ class TestDataProcessor:
         result = classify_grade(sample_dataframe, cutoff=cutoff)
 
         # Check classification logic
-        for idx in result.index:
-            grade = result.loc[idx, 'grade']
-            grade_class = result.loc[idx, 'grade_class']
-
-            if grade >= 2 * cutoff:
-                assert grade_class == 'High Grade', f"Grade {grade} should be High Grade"
-            elif grade >= cutoff:
-                assert grade_class == 'Medium Grade', f"Grade {grade} should be Medium Grade"
-            else:
-                assert grade_class == 'Low Grade', f"Grade {grade} should be Low Grade"
+        grades = result['grade'].to_numpy()
+        expected = np.where(grades >= 2 * cutoff, 'High Grade',
+                            np.where(grades >= cutoff, 'Medium Grade', 'Low Grade'))
+        np.testing.assert_array_equal(
+            result['grade_class'].to_numpy(dtype=object), expected,
+            err_msg="Grades should be classified as High/Medium/Low Grade by cutoff"
+        )
 
     def test_calculate_intervals_adds_column(self, sample_dataframe):
         """Test that calculate_intervals adds interval column."""
@@ -181,10 +189,11 @@ class TestDataProcessor:
 
         result = calculate_intervals(sample_dataframe)
 
-        for idx in result.index[:5]:
-            expected = result.loc[idx, 'to_depth'] - result.loc[idx, 'from_depth']
-            actual = result.loc[idx, 'interval']
-            assert abs(actual - expected) < 0.001, "Interval calculation incorrect"
+        # Check every row against to_depth - from_depth
+        expected = result['to_depth'].to_numpy() - result['from_depth'].to_numpy()
+        actual = result['interval'].to_numpy()
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=0.001,
+                                   err_msg="Interval calculation incorrect")
 
     def test_filter_by_drillhole_filters_correctly(self, sample_dataframe):
         """Test that filter_by_drillhole returns only specified holes."""
@@ -219,7 +228,7 @@ class TestAnalyzer:
 
         result = summary_statistics(sample_dataframe, ['grade', 'mass'])
 
-        assert isinstance(result, pd.DataFrame), "Should return a DataFrame"
+        assert_is_dataframe(result)
 
     def test_summary_statistics_has_correct_stats(self, sample_dataframe):
         """Test that summary statistics includes required statistics."""
@@ -238,7 +247,7 @@ class TestAnalyzer:
 
         result = grade_by_drillhole(sample_dataframe)
 
-        assert isinstance(result, pd.DataFrame), "Should return a DataFrame"
+        assert_is_dataframe(result)
 
     def test_grade_by_drillhole_groups_correctly(self, sample_dataframe):
         """Test that results are grouped by drillhole."""
@@ -257,7 +266,7 @@ class TestAnalyzer:
 
         result = correlation_analysis(sample_dataframe, ['grade', 'mass', 'volume'])
 
-        assert isinstance(result, pd.DataFrame), "Should return a DataFrame"
+        assert_is_dataframe(result)
 
     def test_correlation_analysis_symmetric(self, sample_dataframe):
         """Test that correlation matrix is symmetric."""
@@ -311,7 +320,7 @@ class TestVisualizer:
         """Test that plot_grade_histogram creates an output file."""
         from visualizer import plot_grade_histogram
 
-        output_path = os.path.join(temp_output_dir, 'grade_histogram.png')
+        output_path = str(temp_output_dir / 'grade_histogram.png')
         plot_grade_histogram(sample_dataframe, output_path)
 
         assert os.path.exists(output_path), "Should create histogram file"
@@ -320,7 +329,7 @@ class TestVisualizer:
         """Test that plot_depth_vs_grade creates an output file."""
         from visualizer import plot_depth_vs_grade
 
-        output_path = os.path.join(temp_output_dir, 'depth_vs_grade.png')
+        output_path = str(temp_output_dir / 'depth_vs_grade.png')
         plot_depth_vs_grade(sample_dataframe, output_path)
 
         assert os.path.exists(output_path), "Should create scatter plot file"
@@ -329,7 +338,7 @@ class TestVisualizer:
         """Test that plot_grade_by_drillhole creates an output file."""
         from visualizer import plot_grade_by_drillhole
 
-        output_path = os.path.join(temp_output_dir, 'grade_by_drillhole.png')
+        output_path = str(temp_output_dir / 'grade_by_drillhole.png')
         plot_grade_by_drillhole(sample_dataframe, output_path)
 
         assert os.path.exists(output_path), "Should create box plot file"
@@ -338,7 +347,7 @@ class TestVisualizer:
         """Test that plot_correlation_heatmap creates an output file."""
         from visualizer import plot_correlation_heatmap
 
-        output_path = os.path.join(temp_output_dir, 'correlation_heatmap.png')
+        output_path = str(temp_output_dir / 'correlation_heatmap.png')
         plot_correlation_heatmap(sample_correlation_matrix, output_path)
 
         assert os.path.exists(output_path), "Should create heatmap file"
@@ -347,7 +356,7 @@ class TestVisualizer:
         """Test that generated plot files are not empty."""
         from visualizer import plot_grade_histogram
 
-        output_path = os.path.join(temp_output_dir, 'test_histogram.png')
+        output_path = str(temp_output_dir / 'test_histogram.png')
         plot_grade_histogram(sample_dataframe, output_path)
 
         file_size = os.path.getsize(output_path)
@@ -409,7 +418,7 @@ class TestReporter:
         from reporter import save_report
 
         content = "# Test Report\n\nThis is a test."
-        output_path = os.path.join(temp_output_dir, 'test_report.md')
+        output_path = str(temp_output_dir / 'test_report.md')
 
         save_report(content, output_path)
 
@@ -420,7 +429,7 @@ class TestReporter:
         from reporter import save_report
 
         content = "# Test Report\n\nThis is a test."
-        output_path = os.path.join(temp_output_dir, 'test_report.md')
+        output_path = str(temp_output_dir / 'test_report.md')
 
         save_report(content, output_path)
 
@@ -433,7 +442,7 @@ class TestReporter:
         """Test that export_processed_data creates a CSV file."""
         from reporter import export_processed_data
 
-        output_path = os.path.join(temp_output_dir, 'processed.csv')
+        output_path = str(temp_output_dir / 'processed.csv')
         export_processed_data(sample_dataframe, output_path)
 
         assert os.path.exists(output_path), "Should create CSV file"
@@ -442,7 +451,7 @@ class TestReporter:
         """Test that exported CSV can be read back."""
         from reporter import export_processed_data
 
-        output_path = os.path.join(temp_output_dir, 'processed.csv')
+        output_path = str(temp_output_dir / 'processed.csv')
         export_processed_data(sample_dataframe, output_path)
 
         loaded_df = pd.read_csv(output_path)
@@ -457,53 +466,42 @@ class TestReporter:
 class TestPipeline:
     """Tests for the main pipeline integration."""
 
-    def test_run_pipeline_returns_dict(self, pipeline_config):
+    def test_run_pipeline_returns_dict(self, pipeline_result):
         """Test that run_pipeline returns a dictionary."""
-        from main import run_pipeline
-
-        result = run_pipeline(pipeline_config)
+        result = pipeline_result
 
         assert isinstance(result, dict), "Should return a dictionary"
 
-    def test_run_pipeline_has_required_keys(self, pipeline_config):
+    def test_run_pipeline_has_required_keys(self, pipeline_result):
         """Test that pipeline results have required keys."""
-        from main import run_pipeline
+        result = pipeline_result
+        missing = PIPELINE_KEYS - result.keys()
 
-        result = run_pipeline(pipeline_config)
-        required_keys = ['validation', 'statistics', 'high_grade_count', 'output_files']
+        assert not missing, f"Missing required keys: {sorted(missing)}"
 
-        for key in required_keys:
-            assert key in result, f"Missing required key: {key}"
-
-    def test_run_pipeline_creates_output_files(self, pipeline_config):
+    def test_run_pipeline_creates_output_files(self, pipeline_result, shared_pipeline_config):
         """Test that pipeline creates expected output files."""
-        from main import run_pipeline
-
-        result = run_pipeline(pipeline_config)
+        result = pipeline_result
 
         assert len(result['output_files']) > 0, "Should generate output files"
 
         for filepath in result['output_files']:
-            full_path = os.path.join(pipeline_config['output_dir'], filepath)
+            full_path = os.path.join(shared_pipeline_config['output_dir'], filepath)
             assert os.path.exists(full_path) or os.path.exists(filepath), \
                 f"Output file should exist: {filepath}"
 
-    def test_run_pipeline_validation_report(self, pipeline_config):
+    def test_run_pipeline_validation_report(self, pipeline_result):
         """Test that pipeline validation report is valid."""
-        from main import run_pipeline
-
-        result = run_pipeline(pipeline_config)
+        result = pipeline_result
 
         assert 'total_records' in result['validation'], \
             "Validation should include total_records"
         assert result['validation']['total_records'] > 0, \
             "Should have processed some records"
 
-    def test_run_pipeline_high_grade_count(self, pipeline_config):
+    def test_run_pipeline_high_grade_count(self, pipeline_result):
         """Test that pipeline calculates high grade count."""
-        from main import run_pipeline
-
-        result = run_pipeline(pipeline_config)
+        result = pipeline_result
 
         assert isinstance(result['high_grade_count'], int), \
             "high_grade_count should be an integer"
@@ -527,6 +525,14 @@ class TestPipeline:
 # INTEGRATION WITH ACTUAL DATA
 # ============================================================================
 
+# Skip (rather than silently pass) the content checks when the file is missing;
+# test_prospect_data_exists still fails in that case
+requires_prospect_data = pytest.mark.skipif(
+    not PROSPECT_DATA_PATH.exists(), reason="prospect_data.csv not found"
+)
+
+
+@pytest.mark.integration
 class TestWithProspectData:
     """Tests using the actual prospect_data.csv file."""
 
@@ -535,19 +541,15 @@ class TestWithProspectData:
         assert os.path.exists(prospect_data_path), \
             "prospect_data.csv should exist in data directory"
 
-    def test_prospect_data_has_300_records(self, prospect_data_path):
+    @requires_prospect_data
+    def test_prospect_data_has_300_records(self, prospect_dataframe):
         """Test that prospect data has approximately 300 records."""
-        if os.path.exists(prospect_data_path):
-            df = pd.read_csv(prospect_data_path)
-            assert len(df) >= 280 and len(df) <= 320, \
-                "Should have approximately 300 records"
+        assert len(prospect_dataframe) >= 280 and len(prospect_dataframe) <= 320, \
+            "Should have approximately 300 records"
 
-    def test_prospect_data_has_required_columns(self, prospect_data_path):
+    @requires_prospect_data
+    def test_prospect_data_has_required_columns(self, prospect_dataframe):
         """Test that prospect data has all required columns."""
-        if os.path.exists(prospect_data_path):
-            df = pd.read_csv(prospect_data_path)
-            required_columns = ['sample_id', 'hole_id', 'from_depth', 'to_depth',
-                              'lithology', 'grade', 'mass', 'volume']
+        missing = PROSPECT_COLUMNS - set(prospect_dataframe.columns)
 
-            for col in required_columns:
-                assert col in df.columns, f"Missing required column: {col}"
+        assert not missing, f"Missing required columns: {sorted(missing)}"